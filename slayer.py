@@ -19,20 +19,29 @@ Licensed under MIT License
 """
 
 import asyncio
+import contextlib
+import itertools
 import json
+import multiprocessing
 import os
 import random
+import signal
 import sys
 import time
 import threading
-from typing import Dict, Any, List, Optional
+from array import array
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import (
+    TYPE_CHECKING, Any, Coroutine, Dict, Iterator, List, Optional, Sequence,
+    Tuple, TypeVar, cast,
+)
 from urllib.parse import urlparse
 
 import click
-import requests
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
+from rich.text import Text
 from rich.progress import (
     Progress,
     BarColumn,
@@ -42,6 +51,13 @@ from rich.progress import (
     TaskProgressColumn,
 )
 
+if TYPE_CHECKING:
+    import multiprocessing.synchronize
+
+    # Imported lazily at runtime: it is the slowest import by far, and
+    # --help, --version, config and info never send a request.
+    import requests
+
 # Enterprise imports (degrade gracefully)
 _enterprise_available = False
 try:
@@ -51,6 +67,15 @@ try:
 except ImportError:
     pass
 
+# Faster event loop for the async engine (optional, POSIX only)
+_uvloop_available = False
+try:
+    import uvloop
+    # uvloop.run() only exists from 0.18; older releases fall back to asyncio.
+    _uvloop_available = hasattr(uvloop, "run")
+except ImportError:
+    pass
+
 # ---------------------------------------------------------------------------
 # Constants
 # ---------------------------------------------------------------------------
@@ -72,31 +97,88 @@ SUPPORTED_METHODS = ["GET", "POST", "PUT", "DELETE", "PATCH", "HEAD", "OPTIONS"]
 # ---------------------------------------------------------------------------
 # Banner
 # ---------------------------------------------------------------------------
+# Built once at import as styled Text, so print_banner() skips markup parsing.
+_BANNER = Text(
+    " ____  _        _ __   _______ ____  \n"
+    "/ ___|| |      / \\\\ \\ / / ____|  _ \\ \n"
+    "\\___ \\| |     / _ \\\\ V /|  _| | |_) |\n"
+    " ___) | |___ / ___ \\| | | |___|  _ < \n"
+    "|____/|_____/_/   \\_\\_| |_____|_| \\_\\",
+    style="bold white",
+)
+_BANNER_SUBTITLE = Text(
+    f"HTTP Load Testing and Request Framework  v{__version__}\n", style="dim"
+)
+
+
 def print_banner():
-    banner_text = (
-        "[bold white]"
-        " ____  _        _ __   _______ ____  \n"
-        "/ ___|| |      / \\\\ \\ / / ____|  _ \\ \n"
-        "\\___ \\| |     / _ \\\\ V /|  _| | |_) |\n"
-        " ___) | |___ / ___ \\| | | |___|  _ < \n"
-        "|____/|_____/_/   \\_\\_| |_____|_| \\_\\"
-        "[/bold white]"
-    )
-    console.print(banner_text)
-    console.print(
-        f"[dim]HTTP Load Testing and Request Framework  v{__version__}[/dim]\n"
-    )
+    console.print(_BANNER)
+    console.print(_BANNER_SUBTITLE)
+
+
+# ---------------------------------------------------------------------------
+# Statistics
+# ---------------------------------------------------------------------------
+def summarize_response_times(times: Sequence[float]) -> Dict[str, float]:
+    """
+    Return avg/min/median/p95/p99/max (ms) for a run's latency samples.
+
+    The engines keep samples in a compact ``array('d')`` while a test runs;
+    they are boxed into a list only here, for the one sort that every
+    order statistic is read from.
+    """
+    n = len(times)
+    if not n:
+        return {"avg": 0, "min": 0, "median": 0, "p95": 0, "p99": 0, "max": 0}
+    avg = sum(times) / n
+    times = sorted(times)
+    return {
+        "avg": round(avg, 1),
+        "min": round(times[0], 1),
+        "median": round(times[n // 2], 1),
+        "p95": round(times[int(n * 0.95)], 1) if n > 20 else round(times[-1], 1),
+        "p99": round(times[int(n * 0.99)], 1) if n > 100 else round(times[-1], 1),
+        "max": round(times[-1], 1),
+    }
 
 
 # ============================================================================
 # CORE: Synchronous Load Testing Engine (threading-based)
 # ============================================================================
+class _WorkerStats:
+    """Counters owned by a single load test worker (thread or coroutine)."""
+
+    __slots__ = (
+        "requests", "success", "errors", "total_ms", "response_times", "status_codes",
+    )
+
+    def __init__(self):
+        self.requests: int = 0
+        self.success: int = 0
+        self.errors: int = 0
+        self.total_ms: float = 0.0
+        self.response_times: "array[float]" = array("d")
+        self.status_codes: Dict[int, int] = {}
+
+    def merge(self, other: "_WorkerStats") -> None:
+        """Add another shard's counters into this one."""
+        self.requests += other.requests
+        self.success += other.success
+        self.errors += other.errors
+        self.total_ms += other.total_ms
+        self.response_times.extend(other.response_times)
+        for code, n in other.status_codes.items():
+            self.status_codes[code] = self.status_codes.get(code, 0) + n
+
+
 class LoadTestEngine:
     """
     Thread-based HTTP load testing engine.
 
     Uses requests.Session for keep-alive connections and a pool of worker
-    threads to generate concurrent load against a target URL.
+    threads to generate concurrent load against a target URL. Each worker
+    records into its own _WorkerStats shard, so the request path never
+    contends on a shared lock; shards are merged once the run ends.
     """
 
     def __init__(self):
@@ -107,6 +189,7 @@ class LoadTestEngine:
         self.max_requests: Optional[int] = None
         self.max_time: Optional[int] = None
         self.headers: Dict[str, str] = {}
+        self._header_sets: List[Dict[str, str]] = []
         self.data: Optional[str] = None
         self.timeout: int = 10
 
@@ -116,24 +199,43 @@ class LoadTestEngine:
         self.success_count: int = 0
         self.error_count: int = 0
         self.start_time: float = 0.0
-        self.response_times: List[float] = []
+        self.response_times: "array[float]" = array("d")
         self.status_codes: Dict[int, int] = {}
-        self._lock = threading.Lock()
-        self._session = self._create_session()
+        self._stats: List[_WorkerStats] = []
+        self._issued = itertools.count()
+        # Built per run in run(), once the thread count (pool size) is known.
+        self._session: Optional["requests.Session"] = None
+
+    def _create_session(self, pool_size: int = 10) -> "requests.Session":
+        import requests
+        from requests.adapters import HTTPAdapter
 
-    def _create_session(self) -> requests.Session:
         session = requests.Session()
+        # Every request goes to one host, so a single pool holding one
+        # keep-alive connection per thread; with requests' default of 10,
+        # threads beyond that reconnect and discard a socket per request.
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
         session.headers.update({"Accept": "*/*", "Connection": "keep-alive"})
         return session
 
-    def _worker(self, thread_id: int):
+    def _worker(self, thread_id: int, session: "requests.Session"):
+        stats = self._stats[thread_id]
         while self.running:
+            # next() on itertools.count is atomic, so request slots are
+            # handed out without a lock and exactly max_requests are sent.
+            if self.max_requests and next(self._issued) >= self.max_requests:
+                return
+            if self.max_time and (time.monotonic() - self.start_time) >= self.max_time:
+                self.running = False
+                return
+
             try:
-                headers = self.headers.copy()
-                headers["User-Agent"] = random.choice(USER_AGENTS)
+                headers = random.choice(self._header_sets)
 
-                t0 = time.time()
-                resp = self._session.request(
+                t0 = time.monotonic()
+                resp = session.request(
                     self.method,
                     self.target_url,
                     headers=headers,
@@ -141,29 +243,20 @@ class LoadTestEngine:
                     timeout=self.timeout,
                     allow_redirects=True,
                 )
-                elapsed_ms = (time.time() - t0) * 1000
-
-                with self._lock:
-                    self.requests_count += 1
-                    self.response_times.append(elapsed_ms)
-                    code = resp.status_code
-                    self.status_codes[code] = self.status_codes.get(code, 0) + 1
-                    if 200 <= code < 400:
-                        self.success_count += 1
-                    else:
-                        self.error_count += 1
-
-                    if self.max_requests and self.requests_count >= self.max_requests:
-                        self.running = False
-                        return
-                    if self.max_time and (time.time() - self.start_time) >= self.max_time:
-                        self.running = False
-                        return
+                elapsed_ms = (time.monotonic() - t0) * 1000
+
+                stats.response_times.append(elapsed_ms)
+                stats.total_ms += elapsed_ms
+                code = resp.status_code
+                stats.status_codes[code] = stats.status_codes.get(code, 0) + 1
+                if 200 <= code < 400:
+                    stats.success += 1
+                else:
+                    stats.errors += 1
 
             except Exception:
-                with self._lock:
-                    self.error_count += 1
-                    self.requests_count += 1
+                stats.errors += 1
+            stats.requests += 1
 
             if self.delay > 0:
                 time.sleep(self.delay)
@@ -191,22 +284,30 @@ class LoadTestEngine:
         self.max_requests = max_requests
         self.max_time = max_time
         self.headers = headers or {}
+        # One prebuilt header dict per User-Agent, so workers pick a dict
+        # instead of copying and updating self.headers on every request.
+        self._header_sets = [
+            {**self.headers, "User-Agent": ua} for ua in USER_AGENTS
+        ]
         self.data = data
         self.timeout = timeout
+        self._session = session = self._create_session(pool_size=self.threads)
 
         # Reset counters
         self.requests_count = 0
         self.success_count = 0
         self.error_count = 0
-        self.response_times = []
+        self.response_times = array("d")
         self.status_codes = {}
+        self._stats = [_WorkerStats() for _ in range(self.threads)]
+        self._issued = itertools.count()
         self.running = True
-        self.start_time = time.time()
+        self.start_time = time.monotonic()
 
         # Start workers
         workers: List[threading.Thread] = []
         for i in range(self.threads):
-            t = threading.Thread(target=self._worker, args=(i,), daemon=True)
+            t = threading.Thread(target=self._worker, args=(i, session), daemon=True)
             workers.append(t)
             t.start()
 
@@ -233,27 +334,23 @@ class LoadTestEngine:
                     errors=0,
                 )
                 prev_count = 0
-                prev_time = time.time()
+                prev_time = time.monotonic()
 
-                while self.running:
+                while self.running and any(t.is_alive() for t in workers):
                     time.sleep(0.4)
-                    now = time.time()
+                    now = time.monotonic()
+                    done, errors, avg = self._snapshot()
                     dt = now - prev_time
-                    rps = (self.requests_count - prev_count) / dt if dt > 0 else 0
-                    prev_count = self.requests_count
+                    rps = (done - prev_count) / dt if dt > 0 else 0
+                    prev_count = done
                     prev_time = now
 
-                    avg = 0.0
-                    if self.response_times:
-                        with self._lock:
-                            avg = sum(self.response_times) / len(self.response_times)
-
                     progress.update(
                         task,
-                        completed=self.requests_count if total else None,
+                        completed=done if total else None,
                         rps=rps,
                         avg=avg,
-                        errors=self.error_count,
+                        errors=errors,
                     )
         except KeyboardInterrupt:
             console.print("\n[yellow]Test interrupted.[/yellow]")
@@ -261,11 +358,35 @@ class LoadTestEngine:
             self.running = False
             for t in workers:
                 t.join(timeout=2)
+            session.close()
 
+        self._merge_stats()
         return self._build_results()
 
+    def _snapshot(self) -> Tuple[int, int, float]:
+        """Return (requests, errors, avg_ms) across shards without locking."""
+        done = errors = samples = 0
+        total_ms = 0.0
+        for stats in self._stats:
+            done += stats.requests
+            errors += stats.errors
+            samples += len(stats.response_times)
+            total_ms += stats.total_ms
+        return done, errors, (total_ms / samples if samples else 0.0)
+
+    def _merge_stats(self) -> None:
+        """Fold the per-worker shards into the engine-level counters."""
+        total = _WorkerStats()
+        for stats in self._stats:
+            total.merge(stats)
+        self.requests_count = total.requests
+        self.success_count = total.success
+        self.error_count = total.errors
+        self.response_times = total.response_times
+        self.status_codes = total.status_codes
+
     def _build_results(self) -> Dict[str, Any]:
-        elapsed = time.time() - self.start_time
+        elapsed = time.monotonic() - self.start_time
         rps = self.requests_count / elapsed if elapsed > 0 else 0
         success_rate = (
             (self.success_count / self.requests_count * 100)
@@ -273,9 +394,6 @@ class LoadTestEngine:
             else 0
         )
 
-        times = sorted(self.response_times) if self.response_times else [0]
-        n = len(times)
-
         return {
             "url": self.target_url,
             "method": self.method,
@@ -286,14 +404,7 @@ class LoadTestEngine:
             "duration_s": round(elapsed, 2),
             "rps": round(rps, 2),
             "success_rate": round(success_rate, 1),
-            "response_times": {
-                "avg": round(sum(times) / n, 1) if n else 0,
-                "min": round(times[0], 1) if n else 0,
-                "median": round(times[n // 2], 1) if n else 0,
-                "p95": round(times[int(n * 0.95)], 1) if n > 20 else round(times[-1], 1),
-                "p99": round(times[int(n * 0.99)], 1) if n > 100 else round(times[-1], 1),
-                "max": round(times[-1], 1) if n else 0,
-            },
+            "response_times": summarize_response_times(self.response_times),
             "status_codes": dict(sorted(self.status_codes.items())),
         }
 
@@ -307,7 +418,9 @@ class AsyncLoadTestEngine:
 
     Provides higher throughput via non-blocking I/O and integrates with the
     enterprise features (circuit breakers, caching, rate limiting) when the
-    slayer_enterprise package is installed.
+    slayer_enterprise package is installed. A single event loop tops out at
+    what one core can dispatch, so run_processes() can split a test across
+    several processes, each with its own loop.
     """
 
     async def run(
@@ -322,58 +435,176 @@ class AsyncLoadTestEngine:
         timeout: int = 30,
     ) -> Dict[str, Any]:
         """Run an async load test and return results."""
-        import aiohttp as _aiohttp
+        if not url.startswith(("http://", "https://")):
+            url = "http://" + url
+
+        stats, total_time = await self._execute(
+            url, method, concurrency, max_requests, max_time, headers, data, timeout,
+        )
+        return self._build_results(url, method, concurrency, stats, total_time)
+
+    def run_processes(
+        self,
+        processes: int,
+        url: str,
+        method: str = "GET",
+        concurrency: int = 10,
+        max_requests: Optional[int] = 100,
+        max_time: Optional[int] = None,
+        headers: Optional[Dict[str, str]] = None,
+        data: Optional[str] = None,
+        timeout: int = 30,
+        loop: str = "auto",
+    ) -> Dict[str, Any]:
+        """
+        Run an async load test split across worker processes.
 
+        Requests and concurrency are divided as evenly as possible between
+        the processes; duration-based tests run every process for the full
+        duration. Results are merged into the same shape run() returns.
+        """
         if not url.startswith(("http://", "https://")):
             url = "http://" + url
 
-        results: Dict[str, Any] = {
-            "success": 0,
-            "errors": 0,
-            "response_times": [],
-            "status_codes": {},
-        }
-        lock = asyncio.Lock()
-        stop_event = asyncio.Event()
+        processes = _process_count(processes, concurrency, max_requests)
+        jobs: List[Dict[str, Any]] = [
+            {
+                "url": url,
+                "method": method,
+                "concurrency": _split_evenly(concurrency, processes, i),
+                "max_requests": (
+                    _split_evenly(max_requests, processes, i) if max_requests else None
+                ),
+                "max_time": max_time,
+                "headers": headers,
+                "data": data,
+                "timeout": timeout,
+            }
+            for i in range(processes)
+        ]
+
+        stats = _WorkerStats()
+        total_time = 0.0
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[cyan]{task.description}"),
+            BarColumn(bar_width=30),
+            TaskProgressColumn(),
+            TimeElapsedColumn(),
+            console=console,
+            transient=True,
+        ) as progress:
+            task = progress.add_task(
+                f"Testing (async, {len(jobs)} processes)", total=len(jobs)
+            )
+            # spawn, not fork: Rich's refresh thread is running here and a
+            # forked child could inherit a held console or stdio lock.
+            ctx = multiprocessing.get_context("spawn")
+            stop = ctx.Event()
+            with ProcessPoolExecutor(
+                max_workers=len(jobs),
+                mp_context=ctx,
+                initializer=_init_share_worker,
+                initargs=(stop,),
+            ) as pool:
+                futures = [pool.submit(_run_async_share, job, loop) for job in jobs]
+                collected = set()
+
+                def collect(future):
+                    nonlocal total_time
+                    shard, elapsed = future.result()
+                    stats.merge(shard)
+                    total_time = max(total_time, elapsed)
+                    collected.add(future)
+                    progress.advance(task)
 
-        async def _make_request(session, sem):
-            if stop_event.is_set():
-                return
-            async with sem:
-                if stop_event.is_set():
-                    return
-                req_headers = dict(headers or {})
-                req_headers["User-Agent"] = random.choice(USER_AGENTS)
-                t0 = time.time()
                 try:
-                    async with session.request(
-                        method.upper(),
-                        url,
-                        headers=req_headers,
-                        data=data,
-                        timeout=_aiohttp.ClientTimeout(total=timeout),
-                    ) as resp:
-                        await resp.read()
-                        elapsed_ms = (time.time() - t0) * 1000
-                        async with lock:
-                            results["success"] += 1
-                            results["response_times"].append(elapsed_ms)
-                            code = resp.status
-                            results["status_codes"][code] = (
-                                results["status_codes"].get(code, 0) + 1
-                            )
-                except Exception:
-                    elapsed_ms = (time.time() - t0) * 1000
-                    async with lock:
-                        results["errors"] += 1
-                        results["response_times"].append(elapsed_ms)
-
-        sem = asyncio.Semaphore(concurrency)
+                    for future in as_completed(futures):
+                        collect(future)
+                except KeyboardInterrupt:
+                    console.print("\n[yellow]Test interrupted.[/yellow]")
+                    # Children ignore SIGINT; the event makes them stop handing
+                    # out request slots and return what they have recorded.
+                    stop.set()
+                    for future in futures:
+                        if future not in collected:
+                            collect(future)
+
+        results = self._build_results(url, method, concurrency, stats, total_time)
+        results["processes"] = len(jobs)
+        return results
+
+    async def _execute(
+        self,
+        url: str,
+        method: str,
+        concurrency: int,
+        max_requests: Optional[int],
+        max_time: Optional[int],
+        headers: Optional[Dict[str, str]],
+        data: Optional[str],
+        timeout: int,
+        show_progress: bool = True,
+        stop: Optional["multiprocessing.synchronize.Event"] = None,
+    ) -> Tuple[_WorkerStats, float]:
+        """
+        Drive the requests and return the merged counters and run time.
+
+        Setting ``stop`` (from another process) ends the run early; requests
+        already in flight finish and are counted.
+        """
+        import aiohttp as _aiohttp
+
+        shards: List[_WorkerStats] = []
+        header_sets = [{**(headers or {}), "User-Agent": ua} for ua in USER_AGENTS]
+        perf_ns = time.perf_counter_ns
+
+        async def _make_request(session, stats):
+            req_headers = random.choice(header_sets)
+            t0 = perf_ns()
+            try:
+                async with session.request(
+                    method.upper(),
+                    url,
+                    headers=req_headers,
+                    data=data,
+                    timeout=_aiohttp.ClientTimeout(total=timeout),
+                ) as resp:
+                    await resp.read()
+                    stats.success += 1
+                    code = resp.status
+                    stats.status_codes[code] = stats.status_codes.get(code, 0) + 1
+            except Exception:
+                stats.errors += 1
+            elapsed_ms = (perf_ns() - t0) / 1e6
+            stats.response_times.append(elapsed_ms)
+            stats.total_ms += elapsed_ms
+            stats.requests += 1
+
+        stopped = False
+
+        async def _watch(stop):
+            nonlocal stopped
+            while not stop.is_set():
+                await asyncio.sleep(0.1)
+            stopped = True
+
+        async def _drain(session, slots, on_done):
+            # Workers share one iterator and each next() hands out a single
+            # request slot, so the worker count bounds in-flight requests.
+            stats = _WorkerStats()
+            shards.append(stats)
+            for _ in slots:
+                await _make_request(session, stats)
+                on_done()
+
         connector = _aiohttp.TCPConnector(
             limit=concurrency, limit_per_host=concurrency, force_close=False
         )
 
-        start = time.time()
+        slots: Iterator[object]
+        start = time.monotonic()
+        watcher = asyncio.ensure_future(_watch(stop)) if stop is not None else None
         async with _aiohttp.ClientSession(connector=connector) as session:
             if max_requests:
                 with Progress(
@@ -384,56 +615,126 @@ class AsyncLoadTestEngine:
                     TimeElapsedColumn(),
                     console=console,
                     transient=True,
+                    disable=not show_progress,
                 ) as progress:
                     task = progress.add_task("Testing (async)", total=max_requests)
-                    batch = 0
-                    remaining = max_requests
-                    while remaining > 0:
-                        chunk = min(remaining, concurrency * 4)
-                        tasks = [_make_request(session, sem) for _ in range(chunk)]
-                        await asyncio.gather(*tasks)
-                        remaining -= chunk
-                        batch += chunk
-                        progress.update(task, completed=batch)
+                    slots = itertools.takewhile(
+                        lambda _: not stopped, range(max_requests)
+                    )
+                    await asyncio.gather(
+                        *(
+                            _drain(session, slots, lambda: progress.advance(task))
+                            for _ in range(concurrency)
+                        )
+                    )
             elif max_time:
                 end_time = start + max_time
-                console.print(f"[cyan]Running for {max_time}s ...[/cyan]")
-                while time.time() < end_time:
-                    tasks = [_make_request(session, sem) for _ in range(concurrency)]
-                    await asyncio.gather(*tasks)
+                if show_progress:
+                    console.print(f"[cyan]Running for {max_time}s ...[/cyan]")
+                # Unbounded slots that stop being handed out at the deadline
+                # (or on stop): iter() calls the check once per slot until it
+                # returns False.
+                slots = iter(
+                    lambda: not stopped and time.monotonic() < end_time, False
+                )
+                await asyncio.gather(
+                    *(_drain(session, slots, lambda: None) for _ in range(concurrency))
+                )
+
+        total_time = time.monotonic() - start
+        if watcher is not None:
+            watcher.cancel()
+        results = _WorkerStats()
+        for stats in shards:
+            results.merge(stats)
+        return results, total_time
 
-        total_time = time.time() - start
-        total_reqs = results["success"] + results["errors"]
+    @staticmethod
+    def _build_results(
+        url: str,
+        method: str,
+        concurrency: int,
+        results: _WorkerStats,
+        total_time: float,
+    ) -> Dict[str, Any]:
+        total_reqs = results.success + results.errors
         rps = total_reqs / total_time if total_time > 0 else 0
-        times = sorted(results["response_times"]) if results["response_times"] else [0]
-        n = len(times)
-        success_rate = (results["success"] / total_reqs * 100) if total_reqs > 0 else 0
+        success_rate = (results.success / total_reqs * 100) if total_reqs > 0 else 0
 
         return {
             "url": url,
             "method": method.upper(),
             "concurrency": concurrency,
             "total_requests": total_reqs,
-            "successful": results["success"],
-            "errors": results["errors"],
+            "successful": results.success,
+            "errors": results.errors,
             "duration_s": round(total_time, 2),
             "rps": round(rps, 2),
             "success_rate": round(success_rate, 1),
-            "response_times": {
-                "avg": round(sum(times) / n, 1) if n else 0,
-                "min": round(times[0], 1) if n else 0,
-                "median": round(times[n // 2], 1) if n else 0,
-                "p95": round(times[int(n * 0.95)], 1) if n > 20 else round(times[-1], 1),
-                "p99": round(times[int(n * 0.99)], 1) if n > 100 else round(times[-1], 1),
-                "max": round(times[-1], 1) if n else 0,
-            },
-            "status_codes": dict(sorted(results["status_codes"].items())),
+            "response_times": summarize_response_times(results.response_times),
+            "status_codes": dict(sorted(results.status_codes.items())),
         }
 
 
+T = TypeVar("T")
+
+
+def run_async(coro: Coroutine[Any, Any, T], loop: str = "auto") -> T:
+    """
+    Run ``coro`` to completion.
+
+    ``loop`` is "asyncio", "uvloop", or "auto" to use uvloop when it is
+    installed.
+    """
+    if loop == "uvloop" or (loop == "auto" and _uvloop_available):
+        return cast(T, uvloop.run(coro))
+    return asyncio.run(coro)
+
+
+def _split_evenly(total: int, parts: int, index: int) -> int:
+    """Return the size of share ``index`` when ``total`` is split ``parts`` ways."""
+    return total // parts + (1 if index < total % parts else 0)
+
+
+def _process_count(processes: int, concurrency: int, max_requests: Optional[int]) -> int:
+    """Cap ``processes`` so every process gets a connection and a request."""
+    return max(1, min(processes, concurrency, max_requests or processes))
+
+
+# Set in each process-pool worker by _init_share_worker().
+_share_stop: Optional["multiprocessing.synchronize.Event"] = None
+
+
+def _init_share_worker(stop: "multiprocessing.synchronize.Event") -> None:
+    """Process-pool initializer: leave Ctrl-C to the parent, which sets ``stop``."""
+    global _share_stop
+    _share_stop = stop
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+
+def _run_async_share(job: Dict[str, Any], loop: str) -> Tuple[_WorkerStats, float]:
+    """Process-pool entry point: run one share of an async load test."""
+    return run_async(
+        AsyncLoadTestEngine()._execute(**job, show_progress=False, stop=_share_stop),
+        loop=loop,
+    )
+
+
 # ============================================================================
 # Display helpers
 # ============================================================================
+@contextlib.contextmanager
+def _console_to_stderr():
+    """Point the module console at a stderr console for the duration."""
+    global console
+    saved = console
+    console = Console(stderr=True)
+    try:
+        yield
+    finally:
+        console = saved
+
+
 def display_results(results: Dict[str, Any]) -> None:
     """Render load test results as rich tables."""
     table = Table(title="Test Results", border_style="cyan", show_lines=True)
@@ -446,6 +747,8 @@ def display_results(results: Dict[str, Any]) -> None:
         "Concurrency / Threads",
         str(results.get("threads", results.get("concurrency", "-"))),
     )
+    if "processes" in results:
+        table.add_row("Processes", str(results["processes"]))
     table.add_row("Total Requests", f"{results['total_requests']:,}")
     table.add_row("Successful", f"[green]{results['successful']:,}[/green]")
     table.add_row("Errors", f"[red]{results['errors']:,}[/red]")
@@ -475,7 +778,7 @@ def display_results(results: Dict[str, Any]) -> None:
         console.print(sc_table)
 
 
-def display_response(method: str, url: str, resp: requests.Response) -> None:
+def display_response(method: str, url: str, resp: "requests.Response") -> None:
     """Display a single HTTP response."""
     console.print(f"\n[bold]Status:[/bold]  {resp.status_code}")
     console.print(
@@ -496,6 +799,32 @@ def display_response(method: str, url: str, resp: requests.Response) -> None:
     console.print(h_table)
 
 
+# ---------------------------------------------------------------------------
+# Option parsing
+# ---------------------------------------------------------------------------
+def check_output_dir(ctx, param, value: Optional[str]) -> Optional[str]:
+    """Click callback: reject an output path whose directory can't take it."""
+    # click.Path only checks permissions on files that already exist, so a
+    # missing directory would otherwise surface after the run has finished.
+    if value is not None:
+        directory = os.path.dirname(os.path.abspath(value))
+        if not os.access(directory, os.W_OK):
+            raise click.BadParameter(
+                f"directory '{directory}' does not exist or is not writable."
+            )
+    return value
+
+
+def parse_headers(pairs: Sequence[str]) -> Dict[str, str]:
+    """Parse repeated ``key:value`` options into a header dict."""
+    # partition() splits in one scan; entries without a colon are skipped.
+    return {
+        k.strip(): v.strip()
+        for k, sep, v in (h.partition(":") for h in pairs)
+        if sep
+    }
+
+
 # ============================================================================
 # CLI -- Click command group
 # ============================================================================
@@ -549,37 +878,76 @@ def cli(ctx):
     help="Engine: sync (threading) or async (aiohttp).",
 )
 @click.option(
-    "--output", "-o", default=None, help="Save results to JSON file.",
+    "--workers", "-w", default=1, show_default=True, type=click.IntRange(min=1),
+    help="Processes to split an async test across (one event loop each).",
+)
+@click.option(
+    "--loop",
+    type=click.Choice(["auto", "asyncio", "uvloop"]),
+    default="auto",
+    show_default=True,
+    help="Event loop for the async engine (auto uses uvloop if installed).",
+)
+@click.option(
+    "--format", "-f", "fmt",
+    type=click.Choice(["table", "json"]),
+    default="table",
+    show_default=True,
+    help="Result format on stdout; json moves all other output to stderr.",
+)
+@click.option(
+    "--output", "-o", default=None,
+    type=click.Path(dir_okay=False, writable=True),
+    callback=check_output_dir,
+    help="Save results to JSON file.",
 )
 def test(url, num_requests, concurrency, method, delay, duration, data,
-         header, timeout, engine, output):
+         header, timeout, engine, workers, loop, fmt, output):
     """Run an HTTP load test against a target URL."""
-    print_banner()
+    if loop == "uvloop" and not _uvloop_available:
+        raise click.BadParameter(
+            "uvloop 0.18 or newer is not installed.", param_hint="'--loop'"
+        )
+    # With --format json, stdout carries only the results document (for jq
+    # and friends); the banner and progress display go to stderr instead.
+    with _console_to_stderr() if fmt == "json" else contextlib.nullcontext():
+        print_banner()
 
-    headers: Dict[str, str] = {}
-    for h in header:
-        if ":" in h:
-            k, v = h.split(":", 1)
-            headers[k.strip()] = v.strip()
+        headers = parse_headers(header)
 
-    console.print(
-        Panel.fit(
-            f"[bold]Target:[/bold]       {url}\n"
-            f"[bold]Method:[/bold]       {method.upper()}\n"
-            f"[bold]Requests:[/bold]     "
-            f"{str(duration) + 's' if duration else num_requests}\n"
-            f"[bold]Concurrency:[/bold]  {concurrency}\n"
-            f"[bold]Engine:[/bold]       {engine}",
-            title="Load Test Configuration",
-            border_style="cyan",
+        requested_workers = workers
+        if engine == "async":
+            workers = _process_count(
+                workers, concurrency, None if duration else num_requests
+            )
+
+        console.print(
+            Panel.fit(
+                f"[bold]Target:[/bold]       {url}\n"
+                f"[bold]Method:[/bold]       {method.upper()}\n"
+                f"[bold]Requests:[/bold]     "
+                f"{str(duration) + 's' if duration else num_requests}\n"
+                f"[bold]Concurrency:[/bold]  {concurrency}\n"
+                f"[bold]Engine:[/bold]       {engine}"
+                f"{f' ({workers} processes)' if engine == 'async' and workers > 1 else ''}",
+                title="Load Test Configuration",
+                border_style="cyan",
+            )
         )
-    )
-    console.print()
+        console.print()
+        if engine == "sync" and workers > 1:
+            console.print("[yellow]--workers only applies to the async engine.[/yellow]")
+        elif workers < requested_workers:
+            console.print(
+                f"[yellow]--workers capped at {workers}: each process needs at "
+                f"least one connection and one request.[/yellow]"
+            )
+        if engine == "sync" and loop != "auto":
+            console.print("[yellow]--loop only applies to the async engine.[/yellow]")
 
-    if engine == "async":
-        async_engine = AsyncLoadTestEngine()
-        results = asyncio.run(
-            async_engine.run(
+        if engine == "async" and workers > 1:
+            results = AsyncLoadTestEngine().run_processes(
+                processes=workers,
                 url=url,
                 method=method,
                 concurrency=concurrency,
@@ -588,29 +956,47 @@ def test(url, num_requests, concurrency, method, delay, duration, data,
                 headers=headers,
                 data=data,
                 timeout=timeout,
+                loop=loop,
+            )
+        elif engine == "async":
+            async_engine = AsyncLoadTestEngine()
+            results = run_async(
+                async_engine.run(
+                    url=url,
+                    method=method,
+                    concurrency=concurrency,
+                    max_requests=None if duration else num_requests,
+                    max_time=duration,
+                    headers=headers,
+                    data=data,
+                    timeout=timeout,
+                ),
+                loop=loop,
+            )
+        else:
+            sync_engine = LoadTestEngine()
+            results = sync_engine.run(
+                url=url,
+                method=method,
+                threads=concurrency,
+                delay=delay,
+                max_requests=None if duration else num_requests,
+                max_time=duration,
+                headers=headers,
+                data=data,
+                timeout=timeout,
             )
-        )
-    else:
-        sync_engine = LoadTestEngine()
-        results = sync_engine.run(
-            url=url,
-            method=method,
-            threads=concurrency,
-            delay=delay,
-            max_requests=None if duration else num_requests,
-            max_time=duration,
-            headers=headers,
-            data=data,
-            timeout=timeout,
-        )
 
-    console.print()
-    display_results(results)
+        if fmt == "json":
+            click.echo(json.dumps(results))
+        else:
+            console.print()
+            display_results(results)
 
-    if output:
-        with open(output, "w") as f:
-            json.dump(results, f, indent=2)
-        console.print(f"\n[green]Results saved to {output}[/green]")
+        if output:
+            with open(output, "w") as f:
+                json.dump(results, f, indent=2)
+            console.print(f"\n[green]Results saved to {output}[/green]")
 
 
 # ---------------------------------------------------------------------------
@@ -630,27 +1016,30 @@ def test(url, num_requests, concurrency, method, delay, duration, data,
     help="Request body (JSON string or plain text).",
 )
 @click.option(
-    "--output", "-o", default=None, help="Save response body to file.",
+    "--output", "-o", default=None,
+    type=click.Path(dir_okay=False, writable=True),
+    callback=check_output_dir,
+    help="Save response body to file.",
 )
 @click.option(
     "--verbose", "-v", is_flag=True, help="Show response body.",
 )
 def single_request(url, method, header, data, output, verbose):
     """Make a single HTTP request and display the response."""
+    import requests
+
     print_banner()
 
-    headers: Dict[str, str] = {"User-Agent": random.choice(USER_AGENTS)}
-    for h in header:
-        if ":" in h:
-            k, v = h.split(":", 1)
-            headers[k.strip()] = v.strip()
+    headers = {"User-Agent": random.choice(USER_AGENTS), **parse_headers(header)}
 
-    json_data = None
+    # A JSON body is only validated here and then sent as typed (UTF-8),
+    # rather than parsed into objects for requests to serialize again.
     body = data
-    if data:
+    if data and not any(k.lower() == "content-type" for k in headers):
         try:
-            json_data = json.loads(data)
-            body = None
+            json.loads(data)
+            headers["Content-Type"] = "application/json"
+            body = data.encode("utf-8")
         except json.JSONDecodeError:
             pass
 
@@ -663,22 +1052,30 @@ def single_request(url, method, header, data, output, verbose):
         prog.add_task("req", total=None)
         resp = requests.request(
             method.upper(), url, headers=headers,
-            json=json_data, data=body, timeout=30,
+            data=body, timeout=30, stream=True,
         )
 
-    display_response(method.upper(), url, resp)
-
-    if verbose:
-        body_text = resp.text
-        console.print(f"\n[bold]Body ({len(body_text)} chars):[/bold]")
-        console.print(
-            body_text[:2000] + ("..." if len(body_text) > 2000 else "")
-        )
+    with resp:
+        display_response(method.upper(), url, resp)
+
+        if verbose:
+            body_text = resp.text
+            console.print(f"\n[bold]Body ({len(body_text)} chars):[/bold]")
+            # The body is data, not rich markup: "[...]" sequences are printed
+            # verbatim, and neither the parser nor the highlighter runs on it.
+            console.print(
+                body_text if len(body_text) <= 2000 else body_text[:2000] + "...",
+                markup=False,
+                highlight=False,
+            )
 
-    if output:
-        with open(output, "w") as f:
-            f.write(resp.text)
-        console.print(f"\n[green]Response saved to {output}[/green]")
+        if output:
+            # Copy the raw body to disk in fixed-size chunks instead of
+            # decoding it into one string first (unless -v already read it).
+            with open(output, "wb") as f:
+                for chunk in resp.iter_content(chunk_size=64 * 1024):
+                    f.write(chunk)
+            console.print(f"\n[green]Response saved to {output}[/green]")
 
 
 # ---------------------------------------------------------------------------
@@ -687,6 +1084,8 @@ def single_request(url, method, header, data, output, verbose):
 @cli.command("config")
 @click.option(
     "--output", "-o", default="slayer_config.json", show_default=True,
+    type=click.Path(dir_okay=False, writable=True),
+    callback=check_output_dir,
     help="Output file.",
 )
 def generate_config(output):
@@ -726,6 +1125,12 @@ def info():
         if _enterprise_available
         else "[red]not installed[/red]",
     )
+    table.add_row(
+        "Event loop (uvloop)",
+        "[green]available[/green]"
+        if _uvloop_available
+        else "[dim]not installed or older than 0.18 (using asyncio)[/dim]",
+    )
     table.add_row(
         "Enterprise features",
         "[green]available[/green]"
@@ -755,6 +1160,16 @@ def interactive_mode():
         "engine": "sync",
     }
 
+    from http.cookiejar import DefaultCookiePolicy
+
+    import requests
+
+    # One session for the whole shell, so repeated `request` commands reuse
+    # the pooled keep-alive connection instead of reconnecting each time.
+    # Cookies are refused so each request stays as stateless as before.
+    session = requests.Session()
+    session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+
     def show_status():
         t = Table(border_style="dim", show_header=False, padding=(0, 2))
         t.add_column("Key", style="cyan")
@@ -904,12 +1319,11 @@ def interactive_mode():
                 if len(parts) < 2:
                     console.print("[red]Usage: header <key:value>[/red]")
                 else:
-                    h = " ".join(parts[1:])
-                    if ":" in h:
-                        k, v = h.split(":", 1)
-                        state["headers"][k.strip()] = v.strip()
+                    parsed = parse_headers([" ".join(parts[1:])])
+                    if parsed:
+                        state["headers"].update(parsed)
                         console.print(
-                            f"[green]Header set: {k.strip()}[/green]"
+                            f"[green]Header set: {next(iter(parsed))}[/green]"
                         )
                     else:
                         console.print("[red]Format: key:value[/red]")
@@ -946,7 +1360,7 @@ def interactive_mode():
                 console.print()
                 if state["engine"] == "async":
                     eng = AsyncLoadTestEngine()
-                    results = asyncio.run(
+                    results = run_async(
                         eng.run(
                             url=state["url"],
                             method=state["method"],
@@ -993,7 +1407,7 @@ def interactive_mode():
                     url = "http://" + url
                 hdrs = dict(state["headers"])
                 hdrs["User-Agent"] = random.choice(USER_AGENTS)
-                resp = requests.request(
+                resp = session.request(
                     state["method"],
                     url,
                     headers=hdrs,
@@ -1016,6 +1430,8 @@ def interactive_mode():
         except Exception as e:
             console.print(f"[red]Error: {e}[/red]")
 
+    session.close()
+
 
 # ============================================================================
 # Entry point